@@ -3,16 +3,18 @@ import asyncio
 import logging
 import time
 from datetime import timedelta
-from typing import Any, Dict
+from typing import Any, Mapping
 
 from homeassistant.components import bluetooth
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS, CONF_PASSWORD, Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, LOGGER, UPDATE_INTERVAL_SECONDS, DEFAULT_PASSWORD, CONF_MODEL
+from .const import DOMAIN, LOGGER, UPDATE_INTERVAL_SECONDS, PUSH_MIN_INTERVAL_SECONDS, DEFAULT_PASSWORD, CONF_MODEL
 from .api import PranaBLEDevice
 
 PLATFORMS: list[Platform] = [
@@ -24,6 +26,12 @@ PLATFORMS: list[Platform] = [
     Platform.BUTTON,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    hass.data[DOMAIN] = {}
+    return True
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     address = entry.data[CONF_ADDRESS]
     password = entry.data.get(CONF_PASSWORD, DEFAULT_PASSWORD)
@@ -55,34 +63,39 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     coordinator = PranaDataUpdateCoordinator(hass, api, entry)
     api._data_update_callback = coordinator._handle_api_data_update
-    api._disconnected_callback = coordinator._handle_api_disconnect
+    api._disconnect_callback = coordinator._handle_api_disconnect
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+    hass.data[DOMAIN][entry.entry_id] = {
         "api": api,
         "coordinator": coordinator,
     }
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except ConfigEntryNotReady:
-        pass 
+    # The first BLE refresh can take several seconds; run it alongside platform setup
+    forward_result, refresh_result = await asyncio.gather(
+        hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
+        coordinator.async_config_entry_first_refresh(),
+        return_exceptions=True,
+    )
+    # A failed first refresh is not fatal, the coordinator keeps retrying on its interval
+    for result in (forward_result, refresh_result):
+        if result is refresh_result and isinstance(result, ConfigEntryNotReady): continue
+        if isinstance(result, BaseException):
+            # The concurrent refresh may already hold a BLE connection; close it before a retry opens another
+            await coordinator.async_request_shutdown()
+            hass.data[DOMAIN].pop(entry.entry_id, None)
+            raise result
 
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
-    entry.async_on_unload(coordinator.async_request_shutdown)
     return True
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id, {}).get("coordinator")
+    coordinator = hass.data[DOMAIN].get(entry.entry_id, {}).get("coordinator")
     if coordinator:
          await coordinator.async_request_shutdown()
 
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        data = hass.data[DOMAIN].pop(entry.entry_id, None)
-        if data:
-            await data["api"].stop()
+        hass.data[DOMAIN].pop(entry.entry_id, None)
     return unload_ok
 
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -90,29 +103,55 @@ async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> Non
     data = hass.data[DOMAIN].get(entry.entry_id)
     if data and "api" in data:
         data["api"].auto_restore_display = entry.options.get("auto_restore_display", True)
+        # Filter reset/duration live in the entry, not in device data; re-render without BLE I/O
+        data["coordinator"].async_update_listeners()
         LOGGER.debug("Prana config updated quietly. Reload suppressed.")
 
-class PranaDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
+class PranaDataUpdateCoordinator(DataUpdateCoordinator[Mapping[str, Any]]):
     def __init__(self, hass: HomeAssistant, api: PranaBLEDevice, config_entry: ConfigEntry):
         self.api = api
         self.config_entry = config_entry
         self._shutdown = False
+        self._last_push = 0.0
+        self._pending_push: asyncio.TimerHandle | None = None
         super().__init__(
             hass, LOGGER, name=f"{DOMAIN}-{api.address}",
             update_interval=timedelta(seconds=UPDATE_INTERVAL_SECONDS),
+            always_update=False,
         )
 
-    async def _async_update_data(self) -> Dict[str, Any]:
+    async def _async_update_data(self) -> Mapping[str, Any]:
         try:
             data = await self.api.update_data()
             if not data:
                 raise UpdateFailed("No data returned from device")
-            return data
+            # Fetch RSSI once per poll so the sensor reads it like any other key
+            service_info = bluetooth.async_last_service_info(self.hass, self.api.address, connectable=False)
+            return self.api.update_cached_state(rssi=service_info.rssi if service_info else None)
         except Exception as err:
             raise UpdateFailed(f"Error communicating with device: {err}") from err
 
     @callback
-    def _handle_api_data_update(self, data: dict):
+    def _handle_api_data_update(self, data: Mapping[str, Any]):
+        """Push device data to listeners at most once per PUSH_MIN_INTERVAL_SECONDS."""
+        if self._pending_push is not None: return
+        elapsed = time.monotonic() - self._last_push
+        if elapsed >= PUSH_MIN_INTERVAL_SECONDS:
+            self._flush_pending_data()
+        else:
+            self._pending_push = self.hass.loop.call_later(
+                PUSH_MIN_INTERVAL_SECONDS - elapsed, self._flush_pending_data
+            )
+
+    @callback
+    def _flush_pending_data(self) -> None:
+        self._pending_push = None
+        if self._shutdown: return
+        # Read the snapshot now: polls and writes may have patched it since the frame arrived
+        data = self.api.current_state
+        # Identical frames only need a push to recover from a failed poll
+        if self.last_update_success and data == self.data: return
+        self._last_push = time.monotonic()
         self.async_set_updated_data(data)
 
     @callback
@@ -123,4 +162,7 @@ class PranaDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
     async def async_request_shutdown(self) -> None:
         if self._shutdown: return
         self._shutdown = True
+        if self._pending_push is not None:
+            self._pending_push.cancel()
+            self._pending_push = None
         await self.api.stop()
\ No newline at end of file
@@ -1,31 +1,48 @@
 """API for interacting with Prana BLE devices."""
 import asyncio
+import functools
 import logging
 import struct
 import math
 from datetime import datetime
-from typing import Any, Optional, Callable, Dict
+from types import MappingProxyType
+from typing import Any, Optional, Callable, Dict, Mapping
 
 from bleak import BleakClient, BleakError
+from bleak.backends.characteristic import BleakGATTCharacteristic
 from bleak.backends.device import BLEDevice
 from homeassistant.components import bluetooth
+from homeassistant.helpers.device_registry import DeviceInfo
 from bleak_retry_connector import establish_connection
 
 from .const import (
-    LOGGER, UUID_RWN_CHARACTERISTIC, PRANA_RESP_START_BYTE1, PRANA_RESP_START_BYTE2,
+    DOMAIN, LOGGER, UUID_RWN_CHARACTERISTIC, PRANA_RESP_START_BYTE1, PRANA_RESP_START_BYTE2, PRANA_RESP_PREFIX,
     PRANA_CMD_AUTH, PRANA_CMD_GET_STATE, PRANA_CMD_POWER_ON, PRANA_CMD_POWER_OFF,
     PRANA_CMD_AUTO_MODE, PRANA_CMD_BRIGHTNESS, PRANA_CMD_HEATING, 
     PRANA_CMD_WINTER_MODE, PRANA_CMD_FAN_LOCK, 
-    PRANA_CMD_DISPLAY_LEFT, PRANA_CMD_DISPLAY_RIGHT, PranaMode, PranaDisplayMode, DISPLAY_MODE_MAP
+    PRANA_CMD_DISPLAY_LEFT, PRANA_CMD_DISPLAY_RIGHT, PranaMode, PranaDisplayMode,
+    PRANA_MODE_NAMES, DISPLAY_MODE_NAMES
 )
 
 BLE_TIMEOUT = 30
+STATE_RESPONSE_TIMEOUT = 2.0
+PARSE_DEBOUNCE_SECONDS = 0.25
+MAX_FRAME_LENGTH = 512
 
-def _build_state_request_frame() -> bytearray:
-    return bytearray([0xBE, 0xEF, 0x05, 0x01, 0x00, 0x00, 0x00, 0x00, 0x5A])
+# Temperatures are 14-bit big-endian words spaced 3 bytes apart (offset 48),
+# CO2 and VOC are adjacent big-endian words (offset 61).
+_TEMPS_STRUCT = struct.Struct(">HxHxHxH")
+_AIR_QUALITY_STRUCT = struct.Struct(">HH")
 
-def _build_action_frame(command: int) -> bytearray:
-    return bytearray([0xBE, 0xEF, 0x04, command])
+_STATE_REQUEST_FRAME = PRANA_RESP_PREFIX + bytes([0x05, 0x01, 0x00, 0x00, 0x00, 0x00, 0x5A])
+
+def _build_state_request_frame() -> bytes:
+    return _STATE_REQUEST_FRAME
+
+@functools.lru_cache(maxsize=None)
+def _build_action_frame(command: int) -> bytes:
+    """Action frames only depend on the command byte, so build each one once."""
+    return PRANA_RESP_PREFIX + bytes((0x04, command))
 
 def _build_time_sync_frame() -> bytearray:
     now = datetime.now()
@@ -46,9 +63,18 @@ class PranaBLEApiException(Exception):
     pass
 
 class PranaBLEDevice:
+    __slots__ = (
+        "_device", "_hass", "_password", "_client", "_lock", "_is_connected",
+        "_disconnect_callback", "_data_update_callback", "_current_state", "_state_view",
+        "_disconnect_event", "_buffer", "_parse_handle", "_state_event", "_latest_requests",
+        "polling_enabled", "auto_restore_display",
+        "_virtual_display_mode", "_save_display_mode_callback", "_device_info",
+        "_rwn_char",
+    )
+
     def __init__(self, device: BLEDevice, password: str, hass: Any = None,
                  disconnected_callback: Optional[Callable[[], None]] = None,
-                 data_update_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 data_update_callback: Optional[Callable[[Mapping[str, Any]], None]] = None,
                  initial_display_mode: int = 0,
                  save_display_mode_callback: Optional[Callable[[int], None]] = None):
         self._device = device
@@ -60,14 +86,19 @@ class PranaBLEDevice:
         self._disconnect_callback = disconnected_callback
         self._data_update_callback = data_update_callback
         self._current_state: Dict[str, Any] = {}
+        self._state_view: Mapping[str, Any] = MappingProxyType(self._current_state)
         self._disconnect_event = asyncio.Event()
         self._buffer = bytearray()
-        self._parse_task: Optional[asyncio.Task] = None
+        self._parse_handle: Optional[asyncio.TimerHandle] = None
+        self._state_event = asyncio.Event()
+        self._latest_requests: Dict[str, object] = {}
         self.polling_enabled = True
         self.auto_restore_display = True 
         
         self._virtual_display_mode = initial_display_mode
         self._save_display_mode_callback = save_display_mode_callback
+        self._device_info: Optional[DeviceInfo] = None
+        self._rwn_char: Optional[BleakGATTCharacteristic] = None
 
     def _set_virtual_display_mode(self, mode: int):
         """Updates internal memory and triggers save to HA config."""
@@ -76,6 +107,30 @@ class PranaBLEDevice:
             if self._save_display_mode_callback:
                 self._save_display_mode_callback(mode)
 
+    def _claim_request(self, key: str) -> object:
+        """Register a new request for a setting; older queued ones return False without sending."""
+        token = object()
+        self._latest_requests[key] = token
+        return token
+
+    def _is_superseded(self, key: str, token: object) -> bool:
+        return self._latest_requests.get(key) is not token
+
+    def _update_state(self, changes: Dict[str, Any]) -> None:
+        """Swap in a new state dict so published snapshots are never mutated afterwards."""
+        self._current_state = {**self._current_state, **changes}
+        self._state_view = MappingProxyType(self._current_state)
+
+    @property
+    def current_state(self) -> Mapping[str, Any]:
+        """Latest immutable state snapshot, including values patched after writes."""
+        return self._state_view
+
+    def update_cached_state(self, **changes: Any) -> Mapping[str, Any]:
+        """Record values that were just written to the device and return the new snapshot."""
+        self._update_state(changes)
+        return self._state_view
+
     @property
     def name(self) -> str:
         return self._device.name or self._device.address
@@ -84,35 +139,64 @@ class PranaBLEDevice:
     def address(self) -> str:
         return self._device.address
 
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Device registry info, built once and shared by every entity of this device."""
+        if self._device_info is None:
+            # Clean up the device name
+            clean_name = self.name
+            if clean_name and clean_name.startswith("PRNAQaq"):
+                clean_name = clean_name.replace("PRNAQaq", "").strip()
+                if not clean_name:
+                    clean_name = "Prana Recuperator"
+
+            self._device_info = DeviceInfo(
+                identifiers={(DOMAIN, self.address)},
+                name=clean_name,
+                manufacturer="Prana",
+                model="V2 Recuperator",
+            )
+        return self._device_info
+
     @property
     def is_connected(self) -> bool:
-        return self._client is not None and self._client.is_connected
+        return self._is_connected
 
     async def set_polling(self, enable: bool):
         self.polling_enabled = enable
         if not enable:
             await self.stop()
 
+    def _mark_disconnected(self) -> bool:
+        """Reset connection state; returns False if the disconnect was already recorded."""
+        self._client = None
+        self._rwn_char = None
+        self._is_connected = False
+        if self._disconnect_event.is_set(): return False
+        self._disconnect_event.set()
+        return True
+
     def _handle_disconnect(self, client: BleakClient) -> None:
-        if not self._disconnect_event.is_set():
-            self._client = None
-            self._is_connected = False
-            self._disconnect_event.set()
-            if self._disconnect_callback:
-                self._disconnect_callback()
-
-    async def _notification_handler(self, sender: int, data: bytearray) -> None:
-        if len(data) >= 2 and data[0] == PRANA_RESP_START_BYTE1 and data[1] == PRANA_RESP_START_BYTE2:
-            self._buffer = bytearray(data)
+        if self._client is not None and client is not self._client: return
+        if self._mark_disconnected() and self._disconnect_callback:
+            self._disconnect_callback()
+
+    def _notification_handler(self, sender: int, data: bytearray) -> None:
+        """Only reassemble chunks here; parsing runs once the frame has gone quiet."""
+        if data.startswith(PRANA_RESP_PREFIX):
+            self._buffer[:] = data
+        elif len(self._buffer) + len(data) > MAX_FRAME_LENGTH:
+            LOGGER.debug("Dropping %s byte chunk, frame buffer full", len(data))
+            return
         else:
             self._buffer.extend(data)
 
-        if self._parse_task:
-            self._parse_task.cancel()
-        self._parse_task = asyncio.create_task(self._debounce_parse())
+        if self._parse_handle:
+            self._parse_handle.cancel()
+        self._parse_handle = asyncio.get_running_loop().call_later(PARSE_DEBOUNCE_SECONDS, self._parse_buffer)
 
-    async def _debounce_parse(self):
-        await asyncio.sleep(0.25)
+    def _parse_buffer(self) -> None:
+        self._parse_handle = None
         if len(self._buffer) > 9:
             cmd = self._buffer[2]
             if cmd == 0x05: 
@@ -136,12 +220,7 @@ class PranaBLEDevice:
             base_idx = data[20]
             new_state["base_mode_index"] = base_idx
             
-            if base_idx == 1:
-                new_state["mode"] = "Auto"
-            elif base_idx == 2:
-                new_state["mode"] = "Auto+"
-            else:
-                new_state["mode"] = "Manual"
+            new_state["mode"] = PRANA_MODE_NAMES.get(base_idx, "Manual")
 
             new_state["fans_locked"] = bool(data[22])
             new_state["speed"] = data[26] // 10
@@ -149,20 +228,19 @@ class PranaBLEDevice:
             new_state["speed_out"] = data[34] // 10
             new_state["winter_mode_active"] = bool(data[42])
 
-            def convert_temp(offset):
-                return (struct.unpack_from('>H', data, offset)[0] & 0x3FFF) / 10.0
-
             # SWAPPED: 48 is now Supply, 54 is now Indoor
-            new_state["temp_supply"] = convert_temp(48)
-            new_state["temp_out"] = convert_temp(51)
-            new_state["temp_in"] = convert_temp(54)
-            new_state["temp_exhaust"] = convert_temp(57)
+            t_supply, t_out, t_in, t_exhaust = _TEMPS_STRUCT.unpack_from(data, 48)
+            new_state["temp_supply"] = (t_supply & 0x3FFF) / 10.0
+            new_state["temp_out"] = (t_out & 0x3FFF) / 10.0
+            new_state["temp_in"] = (t_in & 0x3FFF) / 10.0
+            new_state["temp_exhaust"] = (t_exhaust & 0x3FFF) / 10.0
 
             hum = data[60] - 128
             if 0 < hum < 100: new_state["humidity"] = hum
 
-            new_state["co2"] = struct.unpack_from('>H', data, 61)[0] & 0x3FFF
-            new_state["voc"] = struct.unpack_from('>H', data, 63)[0] & 0x7FFF
+            co2, voc = _AIR_QUALITY_STRUCT.unpack_from(data, 61)
+            new_state["co2"] = co2 & 0x3FFF
+            new_state["voc"] = voc & 0x7FFF
             new_state["pressure"] = 512 + data[78]
             
             dev_disp = data[99]
@@ -170,10 +248,7 @@ class PranaBLEDevice:
                 LOGGER.info("Self-healing display mode from %s to %s", self._virtual_display_mode, dev_disp)
                 self._set_virtual_display_mode(dev_disp)
 
-            try:
-                new_state["display_mode"] = DISPLAY_MODE_MAP[PranaDisplayMode(self._virtual_display_mode)]
-            except Exception:
-                new_state["display_mode"] = "Fan State"
+            new_state["display_mode"] = DISPLAY_MODE_NAMES.get(self._virtual_display_mode, "Fan State")
             
             delta_t = new_state["temp_in"] - new_state["temp_out"]
             if new_state["power"] and abs(delta_t) >= 1.0:
@@ -187,26 +262,30 @@ class PranaBLEDevice:
                 new_state["efficiency_pct"] = None
                 new_state["efficiency"] = "Unknown"
 
-            self._current_state.update(new_state)
+            self._update_state(new_state)
+            self._state_event.set()
             if self._data_update_callback:
-                self._data_update_callback(self._current_state)
+                self._data_update_callback(self._state_view)
         except Exception as e:
             LOGGER.error("Parse error: %s", e)
 
     async def _ensure_connected_locked(self) -> bool:
         if not self.polling_enabled: return False
-        if self._client and self._client.is_connected: return True
+        if self._is_connected: return True
         try:
              if self._hass:
                  fresh_device = bluetooth.async_ble_device_from_address(self._hass, self.address, connectable=True)
                  if fresh_device: self._device = fresh_device
              self._client = await establish_connection(BleakClient, self._device, self.name, self._handle_disconnect, max_attempts=3)
              if not self._client or not self._client.is_connected: raise BleakError("Connection failed")
+             # Resolve the characteristic once per connection instead of by UUID on every write
+             self._rwn_char = self._client.services.get_characteristic(UUID_RWN_CHARACTERISTIC)
+             if not self._rwn_char: raise BleakError("Prana characteristic not found")
              self._is_connected = True
              self._disconnect_event.clear()
              
              await asyncio.sleep(0.5)
-             await self._client.start_notify(UUID_RWN_CHARACTERISTIC, self._notification_handler)
+             await self._client.start_notify(self._rwn_char, self._notification_handler)
              await asyncio.sleep(0.2)
              
              await self._send_command_locked(_build_time_sync_frame())
@@ -218,46 +297,58 @@ class PranaBLEDevice:
 
     async def _disconnect_client(self):
         client = self._client
-        self._client = None
-        self._is_connected = False
+        self._mark_disconnected()
         if client:
             try: await client.disconnect()
             except: pass
-        if not self._disconnect_event.is_set():
-            self._disconnect_event.set()
 
     async def stop(self) -> None:
         await self._disconnect_client()
 
-    async def _send_command_locked(self, frame: bytearray) -> bool:
-        if not self._client or not self._client.is_connected: return False
-        self._buffer = bytearray() 
+    async def _send_command_locked(self, frame: bytes) -> bool:
+        if not self._is_connected: return False
+        self._buffer.clear()
         try:
-            await self._client.write_gatt_char(UUID_RWN_CHARACTERISTIC, frame, response=True)
+            await self._client.write_gatt_char(self._rwn_char, frame, response=True)
             return True
         except Exception:
             self._handle_disconnect(self._client)
             return False
 
-    async def _execute_action(self, frame: bytearray) -> bool:
+    async def _request_state_locked(self) -> bool:
+        """Request a state frame and wait until it has been parsed (or time out)."""
+        self._state_event.clear()
+        if not await self._send_command_locked(_build_state_request_frame()): return False
+        try:
+            await asyncio.wait_for(self._state_event.wait(), timeout=STATE_RESPONSE_TIMEOUT)
+            return True
+        except asyncio.TimeoutError:
+            LOGGER.debug("No state response from %s within %ss", self.name, STATE_RESPONSE_TIMEOUT)
+            return False
+
+    async def _execute_action(self, frame: bytes, reset_display: bool = False) -> bool:
         async with self._lock:
             if not await self._ensure_connected_locked(): return False
+            if reset_display: self._set_virtual_display_mode(0)
             success = await self._send_command_locked(frame)
             if success:
                 await asyncio.sleep(0.5)
-                await self._send_command_locked(_build_state_request_frame())
-                await asyncio.sleep(1.0) 
+                await self._request_state_locked()
             return success
 
+    async def _send_repeated_locked(self, frame: bytes, count: int, interval: float = 0.5) -> bool:
+        """Send a button press count times, paced for the device; stop at the first failed write."""
+        for _ in range(count):
+            if not await self._send_command_locked(frame): return False
+            await asyncio.sleep(interval)
+        return True
+
     async def _force_manual_locked(self):
         mode_idx = self._current_state.get("base_mode_index", 0)
         if mode_idx != 0:
             diff = (0 - mode_idx + 3) % 3
-            for _ in range(diff):
-                await self._send_command_locked(_build_action_frame(0x18))
-                await asyncio.sleep(0.5)
-            self._current_state["base_mode_index"] = 0
-            self._current_state["mode"] = "Manual"
+            if await self._send_repeated_locked(_build_action_frame(PRANA_CMD_AUTO_MODE), diff):
+                self._update_state({"base_mode_index": 0, "mode": "Manual"})
 
     async def _set_display_mode_locked(self, target: int) -> bool:
         current = self._virtual_display_mode
@@ -282,28 +373,26 @@ class PranaBLEDevice:
                 if c == 8: c = (c - 1 + 11) % 11 
                 steps += 1
         
-        for _ in range(steps):
-            await self._send_command_locked(_build_action_frame(cmd))
-            await asyncio.sleep(0.5)
-            
+        if not await self._send_repeated_locked(_build_action_frame(cmd), steps): return False
         self._set_virtual_display_mode(target)
         return True
 
-    async def update_data(self) -> Dict[str, Any]:
+    async def update_data(self) -> Mapping[str, Any]:
         async with self._lock:
             if not await self._ensure_connected_locked():
-                return self._current_state.copy()
-            await self._send_command_locked(_build_state_request_frame())
-            await asyncio.sleep(1.0) 
-            return self._current_state.copy()
+                return self._state_view
+            await self._request_state_locked()
+            return self._state_view
 
     async def set_power(self, power: bool) -> bool:
-        self._set_virtual_display_mode(0) 
         cmd = 0x0A if power else 0x01
-        return await self._execute_action(_build_action_frame(cmd))
+        return await self._execute_action(_build_action_frame(cmd), reset_display=True)
     
     async def set_speed(self, speed: int, target: str = "both") -> bool:
+        request_key = f"speed_{target}"
+        token = self._claim_request(request_key)
         async with self._lock:
+             if self._is_superseded(request_key, token): return False
              if not await self._ensure_connected_locked(): return False
              
              previous_display = self._virtual_display_mode
@@ -328,40 +417,19 @@ class PranaBLEDevice:
              if diff == 0: return True
                  
              cmd = cmd_up if diff > 0 else cmd_down
-             for _ in range(abs(diff)):
-                 await self._send_command_locked(_build_action_frame(cmd))
-                 await asyncio.sleep(0.3)
+             if not await self._send_repeated_locked(_build_action_frame(cmd), abs(diff), interval=0.3): return False
              
              if self.auto_restore_display and previous_display != 0:
-                 diff_r = (previous_display - 0 + 11) % 11
-                 diff_l = (0 - previous_display + 11) % 11
-                 steps = 0
-                 if diff_r <= diff_l:
-                     cmd = PRANA_CMD_DISPLAY_RIGHT
-                     c = 0
-                     while c != previous_display:
-                         c = (c + 1) % 11
-                         if c == 8: c = (c + 1) % 11 
-                         steps += 1
-                 else:
-                     cmd = PRANA_CMD_DISPLAY_LEFT
-                     c = 0
-                     while c != previous_display:
-                         c = (c - 1 + 11) % 11
-                         if c == 8: c = (c - 1 + 11) % 11 
-                         steps += 1
-                 for _ in range(steps):
-                     await self._send_command_locked(_build_action_frame(cmd))
-                     await asyncio.sleep(0.5)
-                 self._set_virtual_display_mode(previous_display)
+                 await self._set_display_mode_locked(previous_display)
 
              await asyncio.sleep(0.5)
-             await self._send_command_locked(_build_state_request_frame())
-             await asyncio.sleep(1.0)
+             await self._request_state_locked()
              return True
 
     async def set_mode(self, mode: PranaMode) -> bool:
+        token = self._claim_request("mode")
         async with self._lock:
+             if self._is_superseded("mode", token): return False
              if not await self._ensure_connected_locked(): return False
              
              previous_display = self._virtual_display_mode
@@ -370,85 +438,35 @@ class PranaBLEDevice:
              current_idx = self._current_state.get("base_mode_index", 0)
              target_idx = mode.value
              diff = (target_idx - current_idx + 3) % 3
-             if diff > 0:
-                 for _ in range(diff):
-                     await self._send_command_locked(_build_action_frame(0x18))
-                     await asyncio.sleep(0.5)
+             if not await self._send_repeated_locked(_build_action_frame(PRANA_CMD_AUTO_MODE), diff): return False
                      
              if self.auto_restore_display and previous_display != 0:
-                 diff_r = (previous_display - 0 + 11) % 11
-                 diff_l = (0 - previous_display + 11) % 11
-                 steps = 0
-                 if diff_r <= diff_l:
-                     cmd = PRANA_CMD_DISPLAY_RIGHT
-                     c = 0
-                     while c != previous_display:
-                         c = (c + 1) % 11
-                         if c == 8: c = (c + 1) % 11 
-                         steps += 1
-                 else:
-                     cmd = PRANA_CMD_DISPLAY_LEFT
-                     c = 0
-                     while c != previous_display:
-                         c = (c - 1 + 11) % 11
-                         if c == 8: c = (c - 1 + 11) % 11 
-                         steps += 1
-                 for _ in range(steps):
-                     await self._send_command_locked(_build_action_frame(cmd))
-                     await asyncio.sleep(0.5)
-                 self._set_virtual_display_mode(previous_display)
-
-             await self._send_command_locked(_build_state_request_frame())
-             await asyncio.sleep(1.0)
+                 await self._set_display_mode_locked(previous_display)
+
+             await self._request_state_locked()
              return True
 
     async def set_display_mode(self, mode: PranaDisplayMode) -> bool:
+        token = self._claim_request("display_mode")
         async with self._lock:
+            if self._is_superseded("display_mode", token): return False
             if not await self._ensure_connected_locked(): return False
-            current = self._virtual_display_mode
-            target = mode.value
-            
-            if current == target: return True
-            
-            diff_r = (target - current + 11) % 11
-            diff_l = (current - target + 11) % 11
+            if self._virtual_display_mode == mode.value: return True
             
-            steps = 0
-            if diff_r <= diff_l:
-                cmd = PRANA_CMD_DISPLAY_RIGHT
-                c = current
-                while c != target:
-                    c = (c + 1) % 11
-                    if c == 8: c = (c + 1) % 11 
-                    steps += 1
-            else:
-                cmd = PRANA_CMD_DISPLAY_LEFT
-                c = current
-                while c != target:
-                    c = (c - 1 + 11) % 11
-                    if c == 8: c = (c - 1 + 11) % 11 
-                    steps += 1
-            
-            for _ in range(steps):
-                await self._send_command_locked(_build_action_frame(cmd))
-                await asyncio.sleep(0.5)
-                
-            self._set_virtual_display_mode(target)
-            await self._send_command_locked(_build_state_request_frame())
-            await asyncio.sleep(1.0)
+            if not await self._set_display_mode_locked(mode.value): return False
+            await self._request_state_locked()
             return True
 
     async def set_brightness(self, brightness: int) -> bool:
+        token = self._claim_request("brightness")
         async with self._lock:
+             if self._is_superseded("brightness", token): return False
              if not await self._ensure_connected_locked(): return False
              current_lvl = self._current_state.get("brightness", 1)
              diff = (brightness - current_lvl + 6) % 6
              if diff > 0:
-                 for _ in range(diff):
-                     await self._send_command_locked(_build_action_frame(0x02))
-                     await asyncio.sleep(0.5)
-                 await self._send_command_locked(_build_state_request_frame())
-                 await asyncio.sleep(1.0)
+                 if not await self._send_repeated_locked(_build_action_frame(PRANA_CMD_BRIGHTNESS), diff): return False
+                 await self._request_state_locked()
              return True
 
     async def toggle_heating(self, state: bool) -> bool:
@@ -31,13 +31,12 @@ class PranaButton(PranaEntity, ButtonEntity):
     def __init__(self, coordinator: PranaDataUpdateCoordinator, api: PranaBLEDevice, description: ButtonEntityDescription) -> None:
         super().__init__(coordinator, api)
         self.entity_description = description
-        self._attr_unique_id = f"{api.address}_{description.key}"
+        self._attr_unique_id = f"{self._address}_{description.key}"
 
     async def async_press(self) -> None:
         key = self.entity_description.key
         
         if key == "reset_filter":
-            LOGGER.info("Resetting filter timer memory for %s", self._api.name)
+            LOGGER.info("Resetting filter timer memory for %s", self._name)
             new_data = {**self.coordinator.config_entry.data, "filter_reset_timestamp": time.time()}
-            self.hass.config_entries.async_update_entry(self.coordinator.config_entry, data=new_data)
-            await self.coordinator.async_request_refresh()
\ No newline at end of file
+            self.hass.config_entries.async_update_entry(self.coordinator.config_entry, data=new_data)
\ No newline at end of file
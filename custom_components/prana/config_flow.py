@@ -14,6 +14,8 @@ from bleak_retry_connector import establish_connection
 
 from .const import DOMAIN, DEFAULT_PASSWORD, LOGGER, UUID_PRANA_SERVICE, UUID_RWN_CHARACTERISTIC, CONF_MODEL, MODEL_CHOICES
 
+_PRANA_SERVICE_LC = UUID_PRANA_SERVICE.lower()
+
 USER_ADDRESS_SCHEMA = vol.Schema({vol.Required(CONF_ADDRESS): str})
 AUTH_SCHEMA = vol.Schema({
     vol.Required(CONF_PASSWORD, default=DEFAULT_PASSWORD): str,
@@ -70,7 +72,7 @@ class PranaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if address in current_addresses: continue
             
             name = discovery_info.name or ""
-            has_uuid = UUID_PRANA_SERVICE.lower() in [uuid.lower() for uuid in discovery_info.service_uuids]
+            has_uuid = any(uuid.lower() == _PRANA_SERVICE_LC for uuid in discovery_info.service_uuids)
             
             # --- NEW: Added PRNB to the match rules ---
             has_name = name.startswith("PRNA") or name.startswith("PRNB") or name.startswith("Prana")
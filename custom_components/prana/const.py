@@ -28,12 +28,19 @@ PRANA_CMD_GET_STATE = 0x01
 
 PRANA_RESP_START_BYTE1 = 0xBE
 PRANA_RESP_START_BYTE2 = 0xEF
+PRANA_RESP_PREFIX = bytes((PRANA_RESP_START_BYTE1, PRANA_RESP_START_BYTE2))
 
 class PranaMode(Enum):
     MANUAL = 0
     AUTO = 1
     AUTO_PLUS = 2
 
+PRANA_MODE_NAMES = {
+    PranaMode.MANUAL.value: "Manual",
+    PranaMode.AUTO.value: "Auto",
+    PranaMode.AUTO_PLUS.value: "Auto+",
+}
+
 # Display Enums matching C++ memory
 class PranaDisplayMode(Enum):
     FAN = 0
@@ -60,6 +67,7 @@ DISPLAY_MODE_MAP = {
     PranaDisplayMode.DATE: "Date",
     PranaDisplayMode.TIME: "Time",
 }
+DISPLAY_MODE_NAMES = {mode.value: name for mode, name in DISPLAY_MODE_MAP.items()}
 DISPLAY_MODE_LIST = list(DISPLAY_MODE_MAP.values())
 DISPLAY_MODE_LIST.remove("Date")
 DISPLAY_MODE_LIST.remove("Time")
@@ -72,4 +80,5 @@ MODEL_PREMIUM = "Premium"
 MODEL_PREMIUM_PLUS = "Premium Plus"
 MODEL_CHOICES = [MODEL_STANDARD, MODEL_PREMIUM, MODEL_PREMIUM_PLUS]
 
-UPDATE_INTERVAL_SECONDS = 60
\ No newline at end of file
+UPDATE_INTERVAL_SECONDS = 60
+PUSH_MIN_INTERVAL_SECONDS = 1.0
@@ -1,8 +1,9 @@
 """Base entity for Prana Integration."""
-from homeassistant.helpers.device_registry import DeviceInfo
+from typing import Any
+
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
 from . import PranaDataUpdateCoordinator
 from .api import PranaBLEDevice
 
@@ -14,21 +15,18 @@ class PranaEntity(CoordinatorEntity[PranaDataUpdateCoordinator]):
     def __init__(self, coordinator: PranaDataUpdateCoordinator, api: PranaBLEDevice) -> None:
         super().__init__(coordinator)
         self._api = api
+        self._name = api.name
         self._address = api.address
-        
-        # Clean up the device name
-        clean_name = api.name
-        if clean_name and clean_name.startswith("PRNAQaq"):
-            clean_name = clean_name.replace("PRNAQaq", "").strip()
-            if not clean_name:
-                clean_name = "Prana Recuperator"
+        self._attr_device_info = api.device_info
+        self._written_state: tuple | None = None
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, self._address)},
-            name=clean_name,
-            manufacturer="Prana",
-            model="V2 Recuperator",
-        )
+    @callback
+    def _async_write_state_if_changed(self, *state: Any) -> None:
+        """Write state unless availability and the given values match the last write."""
+        written = (self.available, *state)
+        if written == self._written_state: return
+        self._written_state = written
+        self.async_write_ha_state()
 
     @property
     def available(self) -> bool:
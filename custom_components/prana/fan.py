@@ -1,11 +1,11 @@
 """Fan platform for Prana Integration."""
-import math
 from typing import Any
 from homeassistant.components.fan import FanEntity, FanEntityFeature
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util.percentage import int_states_in_range, percentage_to_ranged_value, ranged_value_to_percentage
+from homeassistant.util.percentage import int_states_in_range, ranged_value_to_percentage
 
 from .const import DOMAIN, LOGGER
 from . import PranaDataUpdateCoordinator
@@ -13,6 +13,7 @@ from .entity import PranaEntity
 from .api import PranaBLEDevice
 
 SPEED_RANGE = (1, 10)
+SPEED_DEBOUNCE_COOLDOWN = 0.3
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     data = hass.data[DOMAIN][entry.entry_id]
@@ -27,52 +28,63 @@ class PranaFanEntity(PranaEntity, FanEntity):
 
     def __init__(self, coordinator: PranaDataUpdateCoordinator, api: PranaBLEDevice) -> None:
         super().__init__(coordinator, api)
-        self._attr_unique_id = f"{api.address}_fan"
+        self._attr_unique_id = f"{self._address}_fan"
+        # Slider drags fire many set_percentage calls; only the last one is sent
+        self._pending_speed: int | None = None
+        self._speed_debouncer = Debouncer(
+            coordinator.hass, LOGGER, cooldown=SPEED_DEBOUNCE_COOLDOWN, immediate=False, function=self._flush_speed
+        )
 
-    @property
-    def is_on(self) -> bool | None:
-        if self.coordinator.data: return self.coordinator.data.get("power")
-        return None
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        # Data may have arrived between construction and listener registration
+        self._update_from_data()
+
+    async def async_will_remove_from_hass(self) -> None:
+        self._speed_debouncer.async_cancel()
+        await super().async_will_remove_from_hass()
 
     @property
-    def percentage(self) -> int | None:
-        if self.coordinator.data and self.coordinator.data.get("speed") is not None:
-            speed = self.coordinator.data.get("speed")
-            if isinstance(speed, int) and SPEED_RANGE[0] <= speed <= SPEED_RANGE[1]:
-                 return ranged_value_to_percentage(SPEED_RANGE, speed)
-            elif speed == 0: return 0
-        return None
+    def is_on(self) -> bool | None:
+        # FanEntity derives is_on from percentage; the device reports power separately
+        return self._attr_is_on
 
     async def async_set_percentage(self, percentage: int) -> None:
         if percentage == 0:
             await self.async_turn_off()
             return
-        prana_speed = math.ceil(percentage_to_ranged_value(SPEED_RANGE, percentage))
-        prana_speed = max(SPEED_RANGE[0], prana_speed)
-        
-        if await self._api.set_speed(prana_speed):
-            self._attr_percentage = percentage
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
+        # Integer ceil(percentage / 10), same as ceil(percentage_to_ranged_value) for a 1..10 range
+        prana_speed = max(SPEED_RANGE[0], min(SPEED_RANGE[1], -(-percentage // 10)))
+
+        self._pending_speed = prana_speed
+        await self._speed_debouncer.async_call()
+
+    async def _flush_speed(self) -> None:
+        # Loop so a value set while a write is in flight is not lost
+        while self._pending_speed is not None:
+            prana_speed, self._pending_speed = self._pending_speed, None
+            data = self.coordinator.data or {}
+            if data.get("power") and data.get("speed") == prana_speed: continue
+            if await self._api.set_speed(prana_speed):
+                self.coordinator.async_set_updated_data(self._api.update_cached_state(speed=prana_speed))
 
     async def async_turn_on(self, percentage: int | None = None, preset_mode: str | None = None, **kwargs: Any) -> None:
         if percentage is not None:
             await self.async_set_percentage(percentage)
-        else:
-            if await self._api.set_power(True):
-                 self._attr_is_on = True
-                 self.async_write_ha_state()
-                 await self.coordinator.async_request_refresh()
+        elif (self.coordinator.data or {}).get("power") is True:
+            return
+        elif await self._api.set_power(True):
+            self.coordinator.async_set_updated_data(self._api.update_cached_state(power=True))
 
     async def async_turn_off(self, **kwargs: Any) -> None:
+        self._pending_speed = None
+        self._speed_debouncer.async_cancel()
+        if (self.coordinator.data or {}).get("power") is False: return
         if await self._api.set_power(False):
-            self._attr_is_on = False
-            self._attr_percentage = 0
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
+            self.coordinator.async_set_updated_data(self._api.update_cached_state(power=False))
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
+    def _update_from_data(self) -> None:
+        """Normalize coordinator power/speed into the cached fan attributes."""
         is_on_updated = None
         percentage_updated = None
         if self.coordinator.data:
@@ -87,4 +99,8 @@ class PranaFanEntity(PranaEntity, FanEntity):
 
         self._attr_is_on = is_on_updated
         self._attr_percentage = percentage_updated
-        self.async_write_ha_state()
\ No newline at end of file
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._update_from_data()
+        self._async_write_state_if_changed(self._attr_is_on, self._attr_percentage)
\ No newline at end of file
@@ -27,7 +27,7 @@ class PranaNumber(PranaEntity, NumberEntity):
     def __init__(self, coordinator: PranaDataUpdateCoordinator, api: PranaBLEDevice, description: NumberEntityDescription) -> None:
         super().__init__(coordinator, api)
         self.entity_description = description
-        self._attr_unique_id = f"{api.address}_{description.key}"
+        self._attr_unique_id = f"{self._address}_{description.key}"
 
     @property
     def native_value(self) -> float | None:
@@ -48,14 +48,8 @@ class PranaNumber(PranaEntity, NumberEntity):
             success = await self._api.set_speed(int_value, target="out")
 
         if success:
-            self._attr_native_value = float(int_value)
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
+            self.coordinator.async_set_updated_data(self._api.update_cached_state(**{key: int_value}))
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        if self.coordinator.data:
-             val = self.coordinator.data.get(self.entity_description.key)
-             if val is not None:
-                 self._attr_native_value = float(val)
-        self.async_write_ha_state()
\ No newline at end of file
+        self._async_write_state_if_changed(self.native_value)
\ No newline at end of file
@@ -1,7 +1,11 @@
 """Select platform for Prana Integration."""
+from types import MappingProxyType
+from typing import Mapping
+
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, LOGGER, PranaMode, PranaDisplayMode, CONF_MODEL
@@ -14,7 +18,7 @@ MODE_MAP = {
     PranaMode.AUTO: "Auto",
     PranaMode.AUTO_PLUS: "Auto+",
 }
-MODE_NAME_TO_ENUM = {v: k for k, v in MODE_MAP.items()}
+MODE_NAME_TO_ENUM: Mapping[str, PranaMode] = MappingProxyType({v: k for k, v in MODE_MAP.items()})
 
 DISPLAY_MODE_MAP = {
     PranaDisplayMode.FAN: "Fan State",
@@ -26,7 +30,9 @@ DISPLAY_MODE_MAP = {
     PranaDisplayMode.AIR_QUALITY: "Efficiency", 
     PranaDisplayMode.PRESSURE: "Pressure",
 }
-DISPLAY_MODE_NAME_TO_ENUM = {v: k for k, v in DISPLAY_MODE_MAP.items()}
+DISPLAY_MODE_NAME_TO_ENUM: Mapping[str, PranaDisplayMode] = MappingProxyType({v: k for k, v in DISPLAY_MODE_MAP.items()})
+
+SELECT_DEBOUNCE_COOLDOWN = 0.3
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     data = hass.data[DOMAIN][entry.entry_id]
@@ -56,7 +62,15 @@ class PranaSelect(PranaEntity, SelectEntity):
     def __init__(self, coordinator: PranaDataUpdateCoordinator, api: PranaBLEDevice, description: SelectEntityDescription) -> None:
         super().__init__(coordinator, api)
         self.entity_description = description
-        self._attr_unique_id = f"{api.address}_{description.key}"
+        self._attr_unique_id = f"{self._address}_{description.key}"
+        self._pending_option: str | None = None
+        self._option_debouncer = Debouncer(
+            coordinator.hass, LOGGER, cooldown=SELECT_DEBOUNCE_COOLDOWN, immediate=False, function=self._flush_option
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        self._option_debouncer.async_cancel()
+        await super().async_will_remove_from_hass()
 
     @property
     def current_option(self) -> str | None:
@@ -65,14 +79,23 @@ class PranaSelect(PranaEntity, SelectEntity):
         return None
 
     async def async_select_option(self, option: str) -> None:
-        if self.entity_description.key == "mode" and option in MODE_NAME_TO_ENUM:
-            await self._api.set_mode(MODE_NAME_TO_ENUM[option])
-        elif self.entity_description.key == "display_mode" and option in DISPLAY_MODE_NAME_TO_ENUM:
-            await self._api.set_display_mode(DISPLAY_MODE_NAME_TO_ENUM[option])
-            
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        self._pending_option = option
+        await self._option_debouncer.async_call()
+
+    async def _flush_option(self) -> None:
+        key = self.entity_description.key
+        # Loop so an option picked while a write is in flight is not lost
+        while self._pending_option is not None:
+            option, self._pending_option = self._pending_option, None
+            if (self.coordinator.data or {}).get(key) == option: continue
+            if key == "mode" and option in MODE_NAME_TO_ENUM:
+                mode = MODE_NAME_TO_ENUM[option]
+                if await self._api.set_mode(mode):
+                    self.coordinator.async_set_updated_data(self._api.update_cached_state(mode=option, base_mode_index=mode.value))
+            elif key == "display_mode" and option in DISPLAY_MODE_NAME_TO_ENUM:
+                if await self._api.set_display_mode(DISPLAY_MODE_NAME_TO_ENUM[option]):
+                    self.coordinator.async_set_updated_data(self._api.update_cached_state(display_mode=option))
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self.async_write_ha_state()
\ No newline at end of file
+        self._async_write_state_if_changed(self.current_option)
\ No newline at end of file
@@ -14,7 +14,6 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
-from homeassistant.components import bluetooth
 
 from .const import DOMAIN, CONF_MODEL
 from . import PranaDataUpdateCoordinator
@@ -47,6 +46,8 @@ ALL_SENSORS = [
     ),
 ]
 
+_MISSING = object()
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator: PranaDataUpdateCoordinator = data["coordinator"]
@@ -61,37 +62,51 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
             if model == "Standard": continue
         active_sensors.append(desc)
 
-    entities = [PranaSensorEntity(coordinator, api, desc) for desc in active_sensors]
+    entities = [SENSOR_CLASSES.get(desc.key, PranaSensorEntity)(coordinator, api, desc) for desc in active_sensors]
     async_add_entities(entities)
 
 class PranaSensorEntity(PranaEntity, SensorEntity):
+    """Sensor that passes a coordinator value through unchanged."""
+
     def __init__(self, coordinator: PranaDataUpdateCoordinator, api: PranaBLEDevice, description: SensorEntityDescription) -> None:
         super().__init__(coordinator, api)
         self.entity_description = description
-        self._attr_unique_id = f"{api.address}_{description.key}"
+        self._attr_unique_id = f"{self._address}_{description.key}"
+        self._key = description.key
 
     @property
     def native_value(self) -> StateType:
-        key = self.entity_description.key
-        if key == "rssi":
-            service_info = bluetooth.async_last_service_info(self.hass, self._api.address, connectable=False)
-            return service_info.rssi if service_info else None
-
-        if key == "filter_remaining":
-            reset_ts = self.coordinator.config_entry.data.get("filter_reset_timestamp", time.time())
-            duration_months = self.coordinator.config_entry.options.get("filter_duration_months", 12)
-            
-            # Converts the months into days, then to a future UTC timestamp for HA
-            expiration_ts = reset_ts + (duration_months * 30.436875 * 86400.0)
-            return datetime.fromtimestamp(expiration_ts, tz=timezone.utc)
-
-        if self.coordinator.data and key in self.coordinator.data:
-            value = self.coordinator.data.get(key)
-            if key in ["winter_mode_active", "auto_mode_active"]:
-                 return "on" if value else "off"
-            return value
-        return None
+        data = self.coordinator.data
+        return data.get(self._key) if data else None
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self.async_write_ha_state()
\ No newline at end of file
+        self._async_write_state_if_changed(self.native_value)
+
+class PranaBoolEnumSensor(PranaSensorEntity):
+    """Sensor that renders a boolean device flag as an on/off enum."""
+
+    @property
+    def native_value(self) -> StateType:
+        data = self.coordinator.data
+        value = data.get(self._key, _MISSING) if data else _MISSING
+        if value is _MISSING: return None
+        return "on" if value else "off"
+
+class PranaFilterSensor(PranaSensorEntity):
+    """Filter replacement date derived from the config entry, not the device."""
+
+    @property
+    def native_value(self) -> datetime:
+        reset_ts = self.coordinator.config_entry.data.get("filter_reset_timestamp", time.time())
+        duration_months = self.coordinator.config_entry.options.get("filter_duration_months", 12)
+        
+        # Converts the months into days, then to a future UTC timestamp for HA
+        expiration_ts = reset_ts + (duration_months * 30.436875 * 86400.0)
+        return datetime.fromtimestamp(expiration_ts, tz=timezone.utc)
+
+SENSOR_CLASSES: dict[str, type[PranaSensorEntity]] = {
+    "winter_mode_active": PranaBoolEnumSensor,
+    "auto_mode_active": PranaBoolEnumSensor,
+    "filter_remaining": PranaFilterSensor,
+}
@@ -29,7 +29,7 @@ class PranaToggleSwitch(PranaEntity, SwitchEntity):
     def __init__(self, coordinator: PranaDataUpdateCoordinator, api: PranaBLEDevice, description: SwitchEntityDescription) -> None:
         super().__init__(coordinator, api)
         self.entity_description = description
-        self._attr_unique_id = f"{api.address}_{description.key}"
+        self._attr_unique_id = f"{self._address}_{description.key}"
 
     @property
     def is_on(self) -> bool | None:
@@ -53,8 +53,7 @@ class PranaToggleSwitch(PranaEntity, SwitchEntity):
         elif key == "fans_locked": success = await self._api.toggle_fans_locked(True)
         
         if success:
-            self._attr_is_on = True
-            self.async_write_ha_state()
+            self.coordinator.async_set_updated_data(self._api.update_cached_state(**{key: True}))
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         key = self.entity_description.key
@@ -69,12 +68,11 @@ class PranaToggleSwitch(PranaEntity, SwitchEntity):
         elif key == "fans_locked": success = await self._api.toggle_fans_locked(False)
         
         if success:
-            self._attr_is_on = False
-            self.async_write_ha_state()
+            self.coordinator.async_set_updated_data(self._api.update_cached_state(**{key: False}))
 
     @callback
     def _handle_coordinator_update(self) -> None:
         if self.entity_description.key != "bt_polling":
             if self.coordinator.data:
                  self._attr_is_on = self.coordinator.data.get(self.entity_description.key)
-        self.async_write_ha_state()
\ No newline at end of file
+        self._async_write_state_if_changed(self.is_on)
\ No newline at end of file